@@ -4,51 +4,424 @@ Uses HTMX for dynamic updates without heavy JavaScript frameworks
 """
 
 from flask import Flask, render_template, request, jsonify
+from flask.json.provider import JSONProvider
 import psycopg2
+import hashlib
 import os
 import json
+import orjson
+import threading
+from cachetools import TTLCache, cached
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
+from psycopg2 import sql
 from psycopg2.extras import RealDictCursor
-from datetime import datetime, date
+from psycopg2.pool import ThreadedConnectionPool
 from config import Config
 from werkzeug.middleware.proxy_fix import ProxyFix
+from flask_compress import Compress
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson - much faster than stdlib json"""
+    @staticmethod
+    def _default(value):
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        return str(value)
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self._default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
 app.config["APPLICATION_ROOT"] = "/heimdall"
+app.json = OrjsonProvider(app)
 app.wsgi_app = ProxyFix(app.wsgi_app, x_prefix=1)
+Compress(app)
 
-def get_db_connection():
-    """Create a database connection"""
-    return psycopg2.connect(
-        host=Config.DB_HOST,
-        port=Config.DB_PORT,
-        database=Config.DB_NAME,
-        user=Config.DB_USER,
-        password=Config.DB_PASSWORD
+def cached_json_response(body):
+    """Wrap a serialized JSON body with an ETag and short-lived cache
+    headers, answering 304 when the client already has this payload"""
+    if isinstance(body, str):
+        body = body.encode()
+    etag = hashlib.md5(body).hexdigest()
+    # flask-compress rewrites outgoing ETags to '<md5>:gzip' / '<md5>:br'
+    # after compressing, so clients echo the suffixed tag back; compare on
+    # the bare hash or conditional requests would never match
+    client_etags = {tag.split(":")[0] for tag in request.if_none_match}
+    if etag in client_etags:
+        resp = app.response_class(status=304)
+    else:
+        resp = app.response_class(body, mimetype="application/json")
+    resp.set_etag(etag)
+    resp.headers["Cache-Control"] = "private, max-age=15, stale-while-revalidate=30"
+    return resp
+
+# Hand DATE/TIMESTAMP/INTERVAL values through as the ISO text libpq already
+# sends instead of constructing Python datetime objects that would only be
+# isoformat()ed straight back to strings
+for _values, _name in (
+    (psycopg2.extensions.PYDATE.values, "DATE_STR"),
+    (psycopg2.extensions.PYDATETIME.values, "TIMESTAMP_STR"),
+    (psycopg2.extensions.PYDATETIMETZ.values, "TIMESTAMPTZ_STR"),
+    (psycopg2.extensions.PYINTERVAL.values, "INTERVAL_STR"),
+):
+    psycopg2.extensions.register_type(
+        psycopg2.extensions.new_type(_values, _name, lambda value, cur: value)
     )
 
-def execute_query(query, params=None):
-    """Execute a query and return results"""
-    conn = get_db_connection()
+class PreparedConnection(psycopg2.extensions.connection):
+    """Connection that remembers which statements it has already PREPAREd"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+
+# Shared connection pools - avoid a fresh TCP+auth handshake per request.
+# POOL targets the primary and is reserved for writes; the GET endpoints
+# read through POOL_RO, which points at the replica when DB_RO_HOST is set
+# (and at the primary otherwise) with read-only transactions enforced so
+# stray writes fail fast.
+POOL = ThreadedConnectionPool(
+    Config.DB_POOL_MIN,
+    Config.DB_POOL_MAX,
+    host=Config.DB_HOST,
+    port=Config.DB_PORT,
+    database=Config.DB_NAME,
+    user=Config.DB_USER,
+    password=Config.DB_PASSWORD,
+    connection_factory=PreparedConnection
+)
+
+POOL_RO = ThreadedConnectionPool(
+    Config.DB_POOL_MIN,
+    Config.DB_POOL_MAX,
+    host=Config.DB_RO_HOST,
+    port=Config.DB_RO_PORT,
+    database=Config.DB_NAME,
+    user=Config.DB_USER,
+    password=Config.DB_PASSWORD,
+    options="-c default_transaction_read_only=on",
+    connection_factory=PreparedConnection
+)
+
+# getconn() raises PoolError immediately when the pool is exhausted, which
+# under the gevent runtime (worker_connections >> DB_POOL_MAX) would turn
+# request bursts into 500s. Gate checkouts behind a semaphore per pool so
+# excess callers wait for a free slot instead; gevent patches threading,
+# so waiters yield cooperatively under gunicorn.
+_POOL_SLOTS = {
+    id(POOL): threading.BoundedSemaphore(Config.DB_POOL_MAX),
+    id(POOL_RO): threading.BoundedSemaphore(Config.DB_POOL_MAX),
+}
+
+def _getconn(pool):
+    _POOL_SLOTS[id(pool)].acquire()
+    try:
+        return pool.getconn()
+    except Exception:
+        _POOL_SLOTS[id(pool)].release()
+        raise
+
+def _putconn(pool, conn):
+    try:
+        pool.putconn(conn)
+    finally:
+        _POOL_SLOTS[id(pool)].release()
+
+# Safely quoted schema identifier shared by all statement templates
+_SCHEMA = sql.Identifier(Config.DB_SCHEMA)
+
+# Server-side prepared statements for the hot queries, composed once at
+# import time with the schema identifier properly quoted. Optional filters use
+# "($n IS NULL OR ...)" guards and the variadic IN lists use "= ANY($n)" on
+# an array parameter, so every statement has a fixed shape and Postgres
+# parses/plans each one once per connection instead of once per request.
+PREPARED_STATEMENTS = {
+    "heimdall_accounts": sql.SQL("""
+        PREPARE heimdall_accounts AS
+        SELECT DISTINCT account
+        FROM {schema}.mv_order_dimensions
+        ORDER BY account
+    """).format(schema=_SCHEMA),
+    "heimdall_dates": sql.SQL("""
+        PREPARE heimdall_dates (text) AS
+        WITH RECURSIVE t AS (
+            (SELECT DATE(created_at) AS order_date
+             FROM {schema}.shoonya_orders
+             WHERE account = $1
+             ORDER BY created_at DESC LIMIT 1)
+            UNION ALL
+            SELECT (SELECT DATE(created_at)
+                    FROM {schema}.shoonya_orders
+                    WHERE account = $1 AND created_at < t.order_date
+                    ORDER BY created_at DESC LIMIT 1)
+            FROM t WHERE t.order_date IS NOT NULL
+        )
+        SELECT order_date FROM t WHERE order_date IS NOT NULL
+    """).format(schema=_SCHEMA),
+    "heimdall_symbols": sql.SQL("""
+        PREPARE heimdall_symbols (text, date) AS
+        WITH RECURSIVE t AS (
+            (SELECT symbol
+             FROM {schema}.shoonya_orders
+             WHERE account = $1
+               AND ($2 IS NULL OR (created_at >= $2 AND created_at < $2 + INTERVAL '1 day'))
+             ORDER BY symbol LIMIT 1)
+            UNION ALL
+            SELECT (SELECT symbol
+                    FROM {schema}.shoonya_orders
+                    WHERE account = $1 AND symbol > t.symbol
+                      AND ($2 IS NULL OR (created_at >= $2 AND created_at < $2 + INTERVAL '1 day'))
+                    ORDER BY symbol LIMIT 1)
+            FROM t WHERE t.symbol IS NOT NULL
+        )
+        SELECT symbol FROM t WHERE symbol IS NOT NULL
+    """).format(schema=_SCHEMA),
+    "heimdall_statuses": sql.SQL("""
+        PREPARE heimdall_statuses (text) AS
+        SELECT DISTINCT status
+        FROM {schema}.mv_order_dimensions
+        WHERE ($1 IS NULL OR account = $1)
+        ORDER BY status
+    """).format(schema=_SCHEMA),
+    "heimdall_filters": sql.SQL("""
+        PREPARE heimdall_filters (text, date) AS
+        WITH f AS (
+            SELECT order_date, symbol, status
+            FROM {schema}.mv_order_dimensions
+            WHERE ($1 IS NULL OR account = $1)
+        )
+        SELECT json_build_object(
+            'accounts', (SELECT array_agg(DISTINCT account) FROM {schema}.mv_order_dimensions),
+            'dates', (SELECT array_agg(DISTINCT order_date ORDER BY order_date DESC) FROM f),
+            'symbols', (SELECT array_agg(DISTINCT symbol ORDER BY symbol) FROM f
+                        WHERE $2 IS NULL OR order_date = $2),
+            'statuses', (SELECT array_agg(DISTINCT status ORDER BY status) FROM f)
+        ) as filters
+    """).format(schema=_SCHEMA),
+    "heimdall_orders": sql.SQL("""
+        PREPARE heimdall_orders (text, date, text[], text[]) AS
+        SELECT COALESCE(json_agg(row_to_json(o)), '[]'::json)::text
+        FROM (
+            SELECT
+                order_id,
+                symbol,
+                exchange,
+                transaction_type,
+                price,
+                qty,
+                status,
+                order_type,
+                product_type,
+                order_time,
+                remarks,
+                spl_remarks,
+                rejection_reason,
+                account,
+                created_at,
+                exit_time,
+                total_order_time
+            FROM {schema}.shoonya_orders
+            WHERE ($1 IS NULL OR account = $1)
+              AND ($2 IS NULL OR (created_at >= $2 AND created_at < $2 + INTERVAL '1 day'))
+              AND ($3 IS NULL OR symbol = ANY($3))
+              AND ($4 IS NULL OR status = ANY($4))
+            ORDER BY order_id ASC LIMIT 500
+        ) o
+    """).format(schema=_SCHEMA),
+    "heimdall_orders_stats": sql.SQL("""
+        PREPARE heimdall_orders_stats (text, date, text[], text[]) AS
+        WITH filtered AS (
+            SELECT
+                order_id,
+                symbol,
+                exchange,
+                transaction_type,
+                price,
+                qty,
+                status,
+                order_type,
+                product_type,
+                order_time,
+                remarks,
+                spl_remarks,
+                rejection_reason,
+                account,
+                created_at,
+                exit_time,
+                total_order_time
+            FROM {schema}.shoonya_orders
+            WHERE ($1 IS NULL OR account = $1)
+              AND ($2 IS NULL OR (created_at >= $2 AND created_at < $2 + INTERVAL '1 day'))
+              AND ($3 IS NULL OR symbol = ANY($3))
+              AND ($4 IS NULL OR status = ANY($4))
+        )
+        SELECT
+            (SELECT json_agg(row_to_json(x))
+             FROM (SELECT * FROM filtered ORDER BY order_id ASC LIMIT 500) x) as orders,
+            (SELECT json_build_object(
+                'total_orders', COUNT(*),
+                'buy_orders', COUNT(*) FILTER (WHERE transaction_type = 'B'),
+                'sell_orders', COUNT(*) FILTER (WHERE transaction_type = 'S'),
+                'completed', COUNT(*) FILTER (WHERE status = 'COMPLETE'),
+                'rejected', COUNT(*) FILTER (WHERE status = 'REJECTED'),
+                'unique_symbols', COUNT(DISTINCT symbol)
+             ) FROM filtered) as stats
+    """).format(schema=_SCHEMA),
+    "heimdall_stats": sql.SQL("""
+        PREPARE heimdall_stats (text, date, text[], text[]) AS
+        SELECT
+            COUNT(*) as total_orders,
+            COUNT(*) FILTER (WHERE transaction_type = 'B') as buy_orders,
+            COUNT(*) FILTER (WHERE transaction_type = 'S') as sell_orders,
+            COUNT(*) FILTER (WHERE status = 'COMPLETE') as completed,
+            COUNT(*) FILTER (WHERE status = 'REJECTED') as rejected,
+            COUNT(DISTINCT symbol) as unique_symbols
+        FROM {schema}.shoonya_orders
+        WHERE ($1 IS NULL OR account = $1)
+          AND ($2 IS NULL OR (created_at >= $2 AND created_at < $2 + INTERVAL '1 day'))
+          AND ($3 IS NULL OR symbol = ANY($3))
+          AND ($4 IS NULL OR status = ANY($4))
+    """).format(schema=_SCHEMA),
+}
+
+def execute_query(query, params=None, pool=None):
+    """Execute a query on a pooled connection and return results"""
+    pool = pool or POOL_RO
+    conn = _getconn(pool)
     try:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(query, params or ())
-            if cur.description:
-                return cur.fetchall()
-            return []
+            rows = cur.fetchall() if cur.description else []
+        conn.commit()
+        return rows
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        _putconn(pool, conn)
+
+# EXECUTE texts have a fixed shape per statement, so each is built once
+_EXECUTE_SQL = {}
+
+def _prepare_statement(conn, name, params):
+    """PREPARE the named statement if this connection hasn't yet, and
+    return its (memoized) EXECUTE text"""
+    if name not in conn.prepared:
+        with conn.cursor() as cur:
+            cur.execute(PREPARED_STATEMENTS[name])
+        conn.commit()
+        conn.prepared.add(name)
+    key = (name, len(params))
+    statement = _EXECUTE_SQL.get(key)
+    if statement is None:
+        if params:
+            statement = f"EXECUTE {name} ({', '.join(['%s'] * len(params))})"
+        else:
+            statement = f"EXECUTE {name}"
+        _EXECUTE_SQL[key] = statement
+    return statement
+
+def execute_prepared(name, params=(), pool=None):
+    """Execute a named prepared statement and return dict rows"""
+    pool = pool or POOL_RO
+    conn = _getconn(pool)
+    try:
+        statement = _prepare_statement(conn, name, params)
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(statement, params or None)
+            rows = cur.fetchall() if cur.description else []
+        conn.commit()
+        return rows
+    except Exception:
+        conn.rollback()
+        raise
     finally:
-        conn.close()
+        _putconn(pool, conn)
+
+def execute_prepared_scalar(name, params=(), pool=None):
+    """Execute a named prepared statement and return the first column of
+    the first row, without any row/dict materialization"""
+    pool = pool or POOL_RO
+    conn = _getconn(pool)
+    try:
+        statement = _prepare_statement(conn, name, params)
+        with conn.cursor() as cur:
+            cur.execute(statement, params or None)
+            row = cur.fetchone()
+        conn.commit()
+        return row[0] if row else None
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        _putconn(pool, conn)
 
 # Available brokers (only Shoonya for now)
 BROKERS = [
     {"id": "shoonya", "name": "Shoonya", "table": "shoonya_orders"}
 ]
 
+# Accounts and statuses change on human timescales, so serve them from a
+# short-lived cache of pre-serialized responses instead of hitting the DB
+# on every dropdown open
+METADATA_CACHE = TTLCache(maxsize=32, ttl=60)
+
+@cached(METADATA_CACHE, key=lambda broker: ("accounts", broker))
+def _accounts_json(broker):
+    accounts = execute_prepared("heimdall_accounts")
+    return orjson.dumps([row["account"] for row in accounts])
+
+@cached(METADATA_CACHE, key=lambda account: ("statuses", account))
+def _statuses_json(account):
+    statuses = execute_prepared("heimdall_statuses", (account,))
+    return orjson.dumps([row["status"] for row in statuses])
+
 # Config files directory
-CONFIG_DIR = "/home/algobaba/DATALORE/hypotheis/FMV_SCALPER/configs"
+CONFIG_DIR = Config.CONFIG_DIR
+
+# Cached /api/config/files payload, dropped by the directory watcher when
+# anything in CONFIG_DIR actually changes
+_files_cache = None
+
+def _invalidate_files_cache():
+    global _files_cache
+    _files_cache = None
+
+def _start_config_watcher():
+    """Watch CONFIG_DIR so the file listing can be served from memory.
+    Returns None (and the listing is rescanned per request) when watchdog
+    isn't installed or the directory doesn't exist.
+
+    Uses PollingObserver rather than the native inotify observer: under
+    the gevent workers the observer threads become greenlets, and
+    inotify's raw blocking os.read() is not gevent-patched, so a quiet
+    config dir would pin the worker's only OS thread. The polling
+    observer only uses time.sleep and queue waits, which gevent patches,
+    and the poll interval still keeps the request hot path syscall-free."""
+    try:
+        from watchdog.observers.polling import PollingObserver
+        from watchdog.events import FileSystemEventHandler
+    except ImportError:
+        return None
+    if not os.path.isdir(CONFIG_DIR):
+        return None
+
+    class _InvalidateHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            _invalidate_files_cache()
+
+    observer = PollingObserver(timeout=2)
+    observer.schedule(_InvalidateHandler(), CONFIG_DIR)
+    observer.daemon = True
+    observer.start()
+    return observer
+
+_config_observer = _start_config_watcher()
 
 @app.route("/")
 def index():
@@ -59,14 +432,8 @@ def index():
 def get_accounts():
     """Get unique accounts for a broker"""
     broker = request.args.get("broker", "shoonya")
-    
-    query = f"""
-        SELECT DISTINCT account 
-        FROM "{Config.DB_SCHEMA}".shoonya_orders 
-        ORDER BY account
-    """
-    accounts = execute_query(query)
-    return jsonify([row["account"] for row in accounts])
+
+    return app.response_class(_accounts_json(broker), mimetype="application/json")
 
 @app.route("/api/dates")
 def get_dates():
@@ -75,15 +442,9 @@ def get_dates():
     
     if not account:
         return jsonify([])
-    
-    query = f"""
-        SELECT DISTINCT DATE(created_at) as order_date
-        FROM "{Config.DB_SCHEMA}".shoonya_orders
-        WHERE account = %s
-        ORDER BY order_date DESC
-    """
-    dates = execute_query(query, (account,))
-    return jsonify([row["order_date"].isoformat() for row in dates if row["order_date"]])
+
+    dates = execute_prepared("heimdall_dates", (account,))
+    return jsonify([row["order_date"] for row in dates if row["order_date"]])
 
 @app.route("/api/symbols")
 def get_symbols():
@@ -93,21 +454,8 @@ def get_symbols():
     
     if not account:
         return jsonify([])
-    
-    query = f"""
-        SELECT DISTINCT symbol
-        FROM "{Config.DB_SCHEMA}".shoonya_orders
-        WHERE account = %s
-    """
-    params = [account]
-    
-    if order_date:
-        query += " AND DATE(created_at) = %s"
-        params.append(order_date)
-    
-    query += " ORDER BY symbol"
-    
-    symbols = execute_query(query, tuple(params))
+
+    symbols = execute_prepared("heimdall_symbols", (account, order_date or None))
     return jsonify([row["symbol"] for row in symbols])
 
 @app.route("/api/statuses")
@@ -115,21 +463,16 @@ def get_statuses():
     """Get unique statuses"""
     account = request.args.get("account")
     
-    query = f"""
-        SELECT DISTINCT status
-        FROM "{Config.DB_SCHEMA}".shoonya_orders
-        WHERE 1=1
-    """
-    params = []
-    
-    if account:
-        query += " AND account = %s"
-        params.append(account)
-    
-    query += " ORDER BY status"
-    
-    statuses = execute_query(query, tuple(params))
-    return jsonify([row["status"] for row in statuses])
+    return app.response_class(_statuses_json(account or None), mimetype="application/json")
+
+@app.route("/api/filters")
+def get_filters():
+    """Get all dropdown filter options in a single round trip"""
+    account = request.args.get("account")
+    order_date = request.args.get("date")
+
+    rows = execute_prepared("heimdall_filters", (account or None, order_date or None))
+    return jsonify(rows[0]["filters"] if rows else {})
 
 @app.route("/api/orders")
 def get_orders():
@@ -140,60 +483,33 @@ def get_orders():
     symbols = request.args.getlist("symbol")  # Multiple symbols
     statuses = request.args.getlist("status")  # Multiple statuses
     
-    query = f"""
-        SELECT 
-            order_id,
-            symbol,
-            exchange,
-            transaction_type,
-            price,
-            qty,
-            status,
-            order_type,
-            product_type,
-            order_time,
-            remarks,
-            spl_remarks,
-            rejection_reason,
-            account,
-            created_at,
-            exit_time,
-            total_order_time
-        FROM "{Config.DB_SCHEMA}".shoonya_orders
-        WHERE 1=1
-    """
-    params = []
-    
-    if account:
-        query += " AND account = %s"
-        params.append(account)
-    
-    if order_date:
-        query += " AND DATE(created_at) = %s"
-        params.append(order_date)
-    
-    if symbols:
-        placeholders = ','.join(['%s'] * len(symbols))
-        query += f" AND symbol IN ({placeholders})"
-        params.extend(symbols)
-    
-    if statuses:
-        placeholders = ','.join(['%s'] * len(statuses))
-        query += f" AND status IN ({placeholders})"
-        params.extend(statuses)
-    
-    query += " ORDER BY order_id ASC LIMIT 500"
-    
-    orders = execute_query(query, tuple(params))
-    # Convert datetime objects to strings
-    for order in orders:
-        for key, value in order.items():
-            if isinstance(value, (datetime, date)):
-                order[key] = value.isoformat() if value else None
-            elif hasattr(value, 'total_seconds'):  # timedelta/interval
-                order[key] = str(value) if value else None
-    
-    return jsonify(orders)
+    payload = execute_prepared_scalar("heimdall_orders", (
+        account or None,
+        order_date or None,
+        symbols or None,
+        statuses or None
+    ))
+    return cached_json_response(payload or "[]")
+
+@app.route("/api/orders_with_stats")
+def get_orders_with_stats():
+    """Get orders and their summary stats from a single scan"""
+    account = request.args.get("account")
+    order_date = request.args.get("date")
+    symbols = request.args.getlist("symbol")  # Multiple symbols
+    statuses = request.args.getlist("status")  # Multiple statuses
+
+    rows = execute_prepared("heimdall_orders_stats", (
+        account or None,
+        order_date or None,
+        symbols or None,
+        statuses or None
+    ))
+    row = rows[0] if rows else {}
+    return cached_json_response(orjson.dumps({
+        "orders": row.get("orders") or [],
+        "stats": row.get("stats") or {}
+    }))
 
 @app.route("/api/stats")
 def get_stats():
@@ -203,38 +519,12 @@ def get_stats():
     symbols = request.args.getlist("symbol")  # Multiple symbols
     statuses = request.args.getlist("status")  # Multiple statuses
     
-    query = f"""
-        SELECT 
-            COUNT(*) as total_orders,
-            COUNT(CASE WHEN transaction_type = 'B' THEN 1 END) as buy_orders,
-            COUNT(CASE WHEN transaction_type = 'S' THEN 1 END) as sell_orders,
-            COUNT(CASE WHEN status = 'COMPLETE' THEN 1 END) as completed,
-            COUNT(CASE WHEN status = 'REJECTED' THEN 1 END) as rejected,
-            COUNT(DISTINCT symbol) as unique_symbols
-        FROM "{Config.DB_SCHEMA}".shoonya_orders
-        WHERE 1=1
-    """
-    params = []
-    
-    if account:
-        query += " AND account = %s"
-        params.append(account)
-    
-    if order_date:
-        query += " AND DATE(created_at) = %s"
-        params.append(order_date)
-    
-    if symbols:
-        placeholders = ','.join(['%s'] * len(symbols))
-        query += f" AND symbol IN ({placeholders})"
-        params.extend(symbols)
-    
-    if statuses:
-        placeholders = ','.join(['%s'] * len(statuses))
-        query += f" AND status IN ({placeholders})"
-        params.extend(statuses)
-    
-    stats = execute_query(query, tuple(params))
+    stats = execute_prepared("heimdall_stats", (
+        account or None,
+        order_date or None,
+        symbols or None,
+        statuses or None
+    ))
     return jsonify(stats[0] if stats else {})
 
 # ============ Config Editor API Routes ============
@@ -242,17 +532,25 @@ def get_stats():
 @app.route("/api/config/files")
 def get_config_files():
     """Get list of JSON config files"""
+    global _files_cache
     try:
-        files = []
-        if os.path.exists(CONFIG_DIR):
-            for f in sorted(os.listdir(CONFIG_DIR)):
-                if f.endswith('.json'):
-                    filepath = os.path.join(CONFIG_DIR, f)
-                    files.append({
-                        "name": f,
-                        "size": os.path.getsize(filepath),
-                        "modified": os.path.getmtime(filepath)
-                    })
+        files = _files_cache if _config_observer is not None else None
+        if files is None:
+            files = []
+            if os.path.exists(CONFIG_DIR):
+                # scandir returns dirents with cached stat data - one syscall
+                # batch instead of a listdir plus two stat() calls per file
+                with os.scandir(CONFIG_DIR) as it:
+                    for entry in it:
+                        if entry.name.endswith('.json') and entry.is_file():
+                            stat = entry.stat()
+                            files.append({
+                                "name": entry.name,
+                                "size": stat.st_size,
+                                "modified": stat.st_mtime
+                            })
+                files.sort(key=lambda f: f["name"])
+            _files_cache = files
         return jsonify({"success": True, "files": files})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
@@ -269,9 +567,11 @@ def get_config_file(filename):
         if not os.path.exists(filepath):
             return jsonify({"success": False, "error": "File not found"}), 404
         
-        with open(filepath, 'r') as f:
-            content = json.load(f)
-        
+        # Read the whole file into bytes and parse with orjson - faster than
+        # json.load streaming from the file object
+        with open(filepath, 'rb') as f:
+            content = orjson.loads(f.read())
+
         return jsonify({"success": True, "filename": filename, "content": content})
     except json.JSONDecodeError as e:
         return jsonify({"success": False, "error": f"Invalid JSON: {str(e)}"}), 400
@@ -298,11 +598,15 @@ def save_config_file(filename):
         
         # Validate it's valid JSON by parsing it
         if isinstance(content, str):
-            content = json.loads(content)
-        
-        with open(filepath, 'w') as f:
+            content = orjson.loads(content)
+
+        # Write to a temp file and rename so a crash mid-write can't leave
+        # a truncated config behind
+        tmp_path = filepath + '.tmp'
+        with open(tmp_path, 'w') as f:
             json.dump(content, f, indent=4)
-        
+        os.replace(tmp_path, filepath)
+
         return jsonify({"success": True, "message": f"File {filename} saved successfully"})
     except json.JSONDecodeError as e:
         return jsonify({"success": False, "error": f"Invalid JSON: {str(e)}"}), 400
@@ -310,4 +614,4 @@ def save_config_file(filename):
         return jsonify({"success": False, "error": str(e)}), 500
 
 if __name__ == "__main__":
-    app.run(debug=True, host="0.0.0.0", port=5000)
+    app.run(debug=True, host="0.0.0.0", port=5000, threaded=True)
@@ -8,6 +8,12 @@ class Config:
     DB_USER = os.getenv("DB_USER", "postgres")
     DB_PASSWORD = os.getenv("DB_PASSWORD", "")
     DB_SCHEMA = "Orders"
+    DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "1"))
+    DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "20"))
+    # Read-only endpoint (hot-standby replica); falls back to the primary
+    DB_RO_HOST = os.getenv("DB_RO_HOST", DB_HOST)
+    DB_RO_PORT = os.getenv("DB_RO_PORT", DB_PORT)
+    CONFIG_DIR = os.getenv("CONFIG_DIR", "/home/algobaba/DATALORE/hypotheis/FMV_SCALPER/configs")
     
     @classmethod
     def get_connection_string(cls):
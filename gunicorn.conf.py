@@ -0,0 +1,17 @@
+"""
+Gunicorn configuration for running Heimdall in production
+
+Launch with: gunicorn -c gunicorn.conf.py app:app
+"""
+
+bind = "0.0.0.0:5000"
+workers = 4
+worker_class = "gevent"
+worker_connections = 1000
+keepalive = 30
+
+def post_fork(server, worker):
+    # Patch psycopg2 before the app is imported so greenlets yield during
+    # DB waits instead of blocking the whole worker
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
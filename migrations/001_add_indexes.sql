@@ -0,0 +1,23 @@
+-- Indexes supporting the Heimdall filter endpoints.
+--
+-- Without these every filtered endpoint sequential-scans shoonya_orders.
+-- Run with psql against the application database; CREATE INDEX CONCURRENTLY
+-- cannot run inside a transaction block.
+
+-- Account + time range: /api/orders, /api/stats, /api/dates
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_shoonya_account_created
+    ON "Orders".shoonya_orders (account, created_at DESC);
+
+-- Account + symbol: /api/symbols and symbol filters
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_shoonya_account_symbol
+    ON "Orders".shoonya_orders (account, symbol);
+
+-- Status filters and /api/statuses
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_shoonya_status
+    ON "Orders".shoonya_orders (status);
+
+-- No functional index on DATE(created_at): the expression is not immutable
+-- when created_at is timestamptz, and no shipped statement filters on it -
+-- the date predicates are plain created_at range scans covered by
+-- idx_shoonya_account_created, and the distinct date listing walks that
+-- same index.
@@ -0,0 +1,20 @@
+-- Materialized view backing the filter dropdowns.
+--
+-- The distinct account/symbol/status/date sets are tiny (dozens of rows)
+-- but were being recomputed by scanning the full shoonya_orders table.
+-- The dropdown queries read this few-KB view instead.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS "Orders".mv_order_dimensions AS
+SELECT DISTINCT account, symbol, status, DATE(created_at) AS order_date
+FROM "Orders".shoonya_orders;
+
+-- Unique index required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_order_dimensions
+    ON "Orders".mv_order_dimensions (account, symbol, status, order_date);
+
+-- Refresh once a minute without blocking readers (requires pg_cron):
+SELECT cron.schedule(
+    'heimdall-mv-refresh',
+    '* * * * *',
+    'REFRESH MATERIALIZED VIEW CONCURRENTLY "Orders".mv_order_dimensions'
+);